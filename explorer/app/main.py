@@ -7,7 +7,14 @@ def main() -> int:
     app = QApplication(sys.argv)
     win = MainWindow()
     win.show()
-    return app.exec()
+    try:
+        # PySide 6.6+: drive the Qt loop through the asyncio integration so
+        # future async work (module/file loaders) shares the native loop.
+        import PySide6.QtAsyncio as QtAsyncio
+    except ImportError:
+        return app.exec()
+    QtAsyncio.run(handle_sigint=True)
+    return 0
 
 
 if __name__ == "__main__":
@@ -58,6 +58,7 @@ class MainWindow(QtWidgets.QMainWindow):
         act_about = help_menu.addAction("About")
         act_about.triggered.connect(self._show_about)
 
+    @QtCore.Slot()
     def _show_about(self) -> None:
         QtWidgets.QMessageBox.information(
             self,
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import importlib
 from typing import Optional
 from PySide6 import QtCore
 from .viewer import ViewerWidget
@@ -6,21 +7,21 @@ from .panels.params_panel import ParamPanel
 from .core.base_module import BaseModule
 from .core.types import ParamSpec
 
-# Import built-in modules here (simple registry for MVP)
-from .modules.linear_transform_2d.module import LinearTransform2DModule
-
 
 class ModuleHost(QtCore.QObject):
     """Loads, configures, and updates the active module."""
 
+    # Built-in modules as "module.path:ClassName" targets (simple registry for
+    # the MVP); resolved lazily so importing the host doesn't load pyvista
+    _registry = {
+        "linear_transform_2d": "app.modules.linear_transform_2d.module:LinearTransform2DModule",
+    }
+
     def __init__(self, viewer: ViewerWidget, param_panel: ParamPanel, parent=None) -> None:
         super().__init__(parent)
         self.viewer = viewer
         self.param_panel = param_panel
         self._active: Optional[BaseModule] = None
-        self._registry = {
-            "linear_transform_2d": LinearTransform2DModule,
-        }
 
         self.param_panel.paramsChanged.connect(self._on_params_changed)
 
@@ -33,9 +34,11 @@ class ModuleHost(QtCore.QObject):
                 self.viewer.clear()
                 self._active = None
 
-        cls = self._registry.get(module_id)
-        if not cls:
+        target = self._registry.get(module_id)
+        if not target:
             raise KeyError(f"Unknown module id: {module_id}")
+        mod_path, cls_name = target.split(":")
+        cls = getattr(importlib.import_module(mod_path), cls_name)
 
         self._active = cls()
         self._active.setup(self.viewer)
@@ -53,4 +56,4 @@ class ModuleHost(QtCore.QObject):
         if not self._active:
             return
         self._active.update(params)
-        self.viewer.render()
+        self.viewer.fast_render()
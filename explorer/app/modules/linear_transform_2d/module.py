@@ -6,35 +6,86 @@ import pyvista as pv
 from app.core.base_module import BaseModule, ViewerFacade
 from app.core.types import ParamSpec
 
+try:
+    from numba import njit
+except ImportError:  # optional accelerator; the plain function works too
+    def njit(**_kwargs):
+        def deco(fn):
+            return fn
+        return deco
+
+
+# Connectivity array for an n-point polyline, cached per unique n: it is
+# identical for every line of the same length, so build it once.
+_CELLS_CACHE: dict[int, np.ndarray] = {}
+
+
+def _cells_for(n: int) -> np.ndarray:
+    cells = _CELLS_CACHE.get(n)
+    if cells is None:
+        cells = np.empty(n + 1, dtype=np.int64)
+        cells[0] = n
+        cells[1:] = np.arange(n)
+        _CELLS_CACHE[n] = cells
+    return cells
+
+
+@njit(cache=True)
+def _eig2x2(a: float, b: float, c: float, d: float):
+    """Closed-form eigenpairs of [[a, b], [c, d]].
+
+    Returns (has_real, l1, v1x, v1y, l2, v2x, v2y) with unnormalized
+    eigenvectors; has_real is False when the eigenvalues are complex.
+    A few FLOPs here replace an np.linalg.eig dispatch per update.
+    """
+    tr = a + d
+    det = a * d - b * c
+    disc = tr * tr / 4.0 - det
+    if disc < 0.0:
+        return False, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    s = math.sqrt(disc)
+    l1 = tr / 2.0 + s
+    l2 = tr / 2.0 - s
+    if abs(b) > 1e-12:
+        v1x, v1y = b, l1 - a
+        v2x, v2y = b, l2 - a
+    elif abs(c) > 1e-12:
+        v1x, v1y = l1 - d, c
+        v2x, v2y = l2 - d, c
+    elif a >= d:
+        # diagonal matrix: eigenvectors are the axes (l1 = max(a, d))
+        v1x, v1y, v2x, v2y = 1.0, 0.0, 0.0, 1.0
+    else:
+        v1x, v1y, v2x, v2y = 0.0, 1.0, 1.0, 0.0
+    return True, l1, v1x, v1y, l2, v2x, v2y
+
 
 def _polyline(points: np.ndarray) -> pv.PolyData:
     """Create a single polyline from Nx3 points."""
-    n = points.shape[0]
     poly = pv.PolyData()
     poly.points = points
-    cells = np.hstack([[n], np.arange(n, dtype=np.int64)])
-    poly.lines = cells
+    poly.lines = _cells_for(points.shape[0])
     return poly
 
 
 def _unit_circle(n: int = 128) -> np.ndarray:
     th = np.linspace(0.0, 2 * math.pi, n, endpoint=True)
     pts = np.c_[np.cos(th), np.sin(th), np.zeros_like(th)]
-    return pts
+    # float32 matches vtkPoints' native precision, so updates are a memcpy
+    return pts.astype(np.float32)
 
 
-def _grid_lines(n: int = 10, extent: float = 1.0) -> List[np.ndarray]:
-    """Return list of polylines (each as Nx3) for a square grid in [-extent, extent]^2."""
+def _grid_lines(n: int = 10, extent: float = 1.0) -> np.ndarray:
+    """Return a (2n, n, 3) block of polylines for a square grid in [-extent, extent]^2."""
     xs = np.linspace(-extent, extent, n)
-    ys = np.linspace(-extent, extent, n)
-    lines: List[np.ndarray] = []
-    for x in xs:
-        yline = np.column_stack([np.full_like(ys, x), ys, np.zeros_like(ys)])
-        lines.append(yline)
-    for y in ys:
-        xline = np.column_stack([xs, np.full_like(xs, y), np.zeros_like(xs)])
-        lines.append(xline)
-    return lines
+    # Build all 2n lines in one broadcast assignment: first the vertical
+    # lines (constant x), then the horizontal ones (constant y).
+    arr = np.zeros((2 * n, n, 3), dtype=np.float32)
+    arr[:n, :, 0] = xs[:, None]
+    arr[:n, :, 1] = xs[None, :]
+    arr[n:, :, 0] = xs[None, :]
+    arr[n:, :, 1] = xs[:, None]
+    return arr
 
 
 class LinearTransform2DModule(BaseModule):
@@ -50,7 +101,25 @@ class LinearTransform2DModule(BaseModule):
     def __init__(self) -> None:
         self.viewer: ViewerFacade | None = None
         self._actors: dict[str, pv.Actor] = {}
-        self._geoms_base: dict[str, List[np.ndarray] | np.ndarray] = {}
+        self._geoms_base: dict[str, np.ndarray] = {}
+        # Circle + grid base points flattened into one (K, 2) array so every
+        # update is a single matmul (see _prepare_base_buffers)
+        self._base_xy: np.ndarray | None = None
+        self._xy_out: np.ndarray | None = None
+        self._circle_n: int = 0
+        # Live numpy views into each polydata's vtkPoints buffer (z stays zero);
+        # update() writes into these and calls Modified(), bypassing the
+        # Python-level `.points =` setter per frame. The whole grid is one
+        # PolyData with 2*grid_n line cells, drawn by a single actor.
+        self._grid_poly: pv.PolyData | None = None
+        self._grid_pts: np.ndarray | None = None
+        self._circle_poly: pv.PolyData | None = None
+        self._circle_pts: np.ndarray | None = None
+        self._eig_polys: List[pv.PolyData] = []
+        self._eig_pts: List[np.ndarray] = []
+        self._last_eig_key: Tuple[bytes, bool] | None = None
+        self._last_key: Tuple[bytes, float, int, bool] | None = None
+        self._A_buf = np.empty((2, 2))
 
     # --------------------- Boilerplate ---------------------
     def meta(self) -> dict:
@@ -77,58 +146,66 @@ class LinearTransform2DModule(BaseModule):
 
         # Base (untransformed) geometry cached for fast updates
         circle = _unit_circle(128)
-        grid = _grid_lines(n=10, extent=1.0)
         self._geoms_base["circle"] = circle
-        self._geoms_base["grid"] = grid
 
         # Create actors once
-        circle_poly = _polyline(circle)
+        # copy: the polydata must not alias the base geometry it is mapped
+        # from — update() mutates its points through the cached view
+        circle_poly = _polyline(circle.copy())
         self._actors["circle"] = plotter.add_mesh(circle_poly, color="black", line_width=2)
+        self._circle_poly = circle_poly
+        self._circle_pts = circle_poly.points
 
-        self._actors["grid"] = []  # type: ignore[assignment]
-        grid_actors: List[pv.Actor] = []
-        for ln in grid:
-            poly = _polyline(ln)
-            act = plotter.add_mesh(poly, color="#999999", line_width=1)
-            grid_actors.append(act)
-        self._actors["grid"] = grid_actors  # type: ignore[assignment]
+        self._grid_poly = None
+        self._rebuild_grid(10)
 
-        # Eigenvector placeholders
-        self._actors["eig1"] = None  # type: ignore[assignment]
-        self._actors["eig2"] = None  # type: ignore[assignment]
+        # Persistent eigenvector actors, hidden until real eigenvectors exist
+        self._eig_polys = []
+        self._eig_pts = []
+        self._last_eig_key = None
+        for key, color in (("eig1", "#d62728"), ("eig2", "#1f77b4")):
+            poly = _polyline(np.zeros((2, 3), dtype=np.float32))
+            act = plotter.add_mesh(poly, color=color, line_width=3)
+            act.SetVisibility(False)
+            self._actors[key] = act
+            self._eig_polys.append(poly)
+            self._eig_pts.append(poly.points)
 
     def update(self, params: dict) -> None:
         if not self.viewer:
             return
         plotter = self.viewer.plotter  # type: ignore[attr-defined]
 
-        A = np.array(params.get("A", [[1, 0], [0, 1]]), dtype=float)
+        # Fill the reusable 2x2 buffer elementwise instead of re-parsing the
+        # nested list into a fresh array every call
+        A_list = params.get("A", ((1.0, 0.0), (0.0, 1.0)))
+        A = self._A_buf
+        A[0, 0] = A_list[0][0]; A[0, 1] = A_list[0][1]
+        A[1, 0] = A_list[1][0]; A[1, 1] = A_list[1][1]
         t = float(params.get("animate_t", 1.0))
         grid_n = int(params.get("grid_n", 10))
         show_eigen = bool(params.get("show_eigen", True))
 
+        # Duplicate emissions (focus events, rebuilt panels) are no-ops
+        key = (A.tobytes(), t, grid_n, show_eigen)
+        if key == self._last_key:
+            return
+        self._last_key = key
+
         # Rebuild grid base if density changed
-        if isinstance(self._geoms_base.get("grid"), list) and len(self._geoms_base["grid"]) != 2 * grid_n:
+        if self._geoms_base["grid"].shape[0] != 2 * grid_n:
             self._rebuild_grid(grid_n)
 
         # Interpolated transform A_t = (1-t) I + t A
         At = (1.0 - t) * np.eye(2) + t * A
+        At32 = At.astype(np.float32)
 
-        # Update circle
-        circle_base: np.ndarray = self._geoms_base["circle"]  # (N, 3)
-        circ_xy = circle_base[:, :2] @ At.T
-        circ = np.column_stack([circ_xy, np.zeros(circ_xy.shape[0])])
-        # mutate the underlying polydata points
-        circle_actor: pv.Actor = self._actors["circle"]
-        circle_poly: pv.PolyData = circle_actor.GetMapper().GetInputAsDataSet()  # type: ignore
-        circle_poly.points = circ
-
-        # Update grid
-        for ln_base, act in zip(self._geoms_base["grid"], self._actors["grid"]):  # type: ignore[index]
-            ln_xy = ln_base[:, :2] @ At.T
-            ln = np.column_stack([ln_xy, np.zeros(ln_xy.shape[0])])
-            poly: pv.PolyData = act.GetMapper().GetInputAsDataSet()  # type: ignore
-            poly.points = ln
+        # Transform circle + grid in one fused matmul, then slice back
+        np.matmul(self._base_xy, At32.T, out=self._xy_out)
+        self._circle_pts[:, :2] = self._xy_out[: self._circle_n]
+        self._circle_poly.GetPoints().Modified()
+        self._grid_pts[:, :2] = self._xy_out[self._circle_n :]
+        self._grid_poly.GetPoints().Modified()
 
         # Eigenvectors (real only)
         self._update_eigenvectors(At, show_eigen)
@@ -136,50 +213,81 @@ class LinearTransform2DModule(BaseModule):
     def teardown(self) -> None:
         self._actors.clear()
         self._geoms_base.clear()
+        self._grid_poly = None
+        self._grid_pts = None
+        self._circle_poly = None
+        self._circle_pts = None
+        self._eig_polys.clear()
+        self._eig_pts.clear()
+        self._last_eig_key = None
+        self._last_key = None
 
     # --------------------- Helpers ---------------------
+    def _prepare_base_buffers(self, grid: np.ndarray) -> None:
+        """Flatten circle + grid base points into one contiguous (K, 2) array
+        so update() transforms everything with a single matmul.
+
+        update() then copies the per-geometry slices into the cached
+        vtkPoints views, avoiding any intermediate allocation.
+
+        Relies on the _geoms_base entries staying pristine: the polydatas
+        own copies of their points (see setup/_rebuild_grid), so mutating
+        them never touches the bases re-read here on grid rebuilds.
+        """
+        circle: np.ndarray = self._geoms_base["circle"]
+        self._circle_n = circle.shape[0]
+        self._base_xy = np.concatenate([circle[:, :2], grid.reshape(-1, 3)[:, :2]])
+        self._xy_out = np.empty_like(self._base_xy)
+
     def _rebuild_grid(self, n: int) -> None:
         plotter = self.viewer.plotter  # type: ignore[attr-defined]
-        # Remove old grid actors
-        for act in self._actors.get("grid", []):  # type: ignore[assignment]
-            try:
-                plotter.remove_actor(act)
-            except Exception:
-                pass
-        lines = _grid_lines(n=n, extent=1.0)
-        self._geoms_base["grid"] = lines
-        grid_actors: List[pv.Actor] = []
-        for ln in lines:
-            poly = _polyline(ln)
-            act = plotter.add_mesh(poly, color="#999999", line_width=1)
-            grid_actors.append(act)
-        self._actors["grid"] = grid_actors  # type: ignore[assignment]
+        grid = _grid_lines(n=n, extent=1.0)  # (2n, n, 3), one contiguous block
+        self._geoms_base["grid"] = grid
+        self._prepare_base_buffers(grid)
+
+        # One PolyData with 2n line cells, drawn by a single actor: swap the
+        # geometry in place on rebuild instead of touching the plotter.
+        n_lines, n_pts = grid.shape[0], grid.shape[1]
+        # copy: the polydata must not alias the base geometry it is mapped from
+        points = grid.reshape(-1, 3).copy()
+        conn = np.empty((n_lines, n_pts + 1), dtype=np.int64)
+        conn[:, 0] = n_pts
+        conn[:, 1:] = np.arange(points.shape[0]).reshape(n_lines, n_pts)
+
+        if self._grid_poly is None:
+            self._grid_poly = pv.PolyData()
+            self._grid_poly.points = points
+            self._grid_poly.lines = conn.ravel()
+            self._actors["grid"] = plotter.add_mesh(self._grid_poly, color="#999999", line_width=1)
+        else:
+            self._grid_poly.points = points
+            self._grid_poly.lines = conn.ravel()
+        self._grid_pts = self._grid_poly.points
 
     def _update_eigenvectors(self, A: np.ndarray, show: bool) -> None:
-        plotter = self.viewer.plotter  # type: ignore[attr-defined]
-        # Clean existing first
-        for key in ("eig1", "eig2"):
-            act = self._actors.get(key)
-            if act is not None:
-                try:
-                    plotter.remove_actor(act)  # type: ignore[arg-type]
-                except Exception:
-                    pass
-                self._actors[key] = None
+        # Skip the decomposition entirely when nothing changed
+        key = (A.tobytes(), show)
+        if key == self._last_eig_key:
+            return
+        self._last_eig_key = key
+
         if not show:
+            for name in ("eig1", "eig2"):
+                self._actors[name].SetVisibility(False)
+            return
+
+        has_real, _l1, v1x, v1y, _l2, v2x, v2y = _eig2x2(A[0, 0], A[0, 1], A[1, 0], A[1, 1])
+        if not has_real:
+            for name in ("eig1", "eig2"):
+                self._actors[name].SetVisibility(False)
             return
 
-        vals, vecs = np.linalg.eig(A)
-        # Draw only real eigenvectors
-        drawn = 0
-        for i in range(2):
-            if abs(vals[i].imag) < 1e-8 and abs(vecs[:, i].imag).max() < 1e-8:
-                v = vecs[:, i].real
-                v = v / (np.linalg.norm(v) + 1e-9)
-                scale = 1.2
-                pts = np.array([[0.0, 0.0, 0.0], [scale * v[0], scale * v[1], 0.0]])
-                poly = _polyline(pts)
-                color = "#d62728" if drawn == 0 else "#1f77b4"
-                act = plotter.add_mesh(poly, color=color, line_width=3)
-                self._actors["eig1" if drawn == 0 else "eig2"] = act
-                drawn += 1
+        # Normalize and scale both eigenvectors in one vectorized pass,
+        # then mutate the persistent actors in place
+        vecs = np.array([[v1x, v2x], [v1y, v2y]], dtype=np.float32)  # column per vector
+        vecs *= 1.2 / (np.linalg.norm(vecs, axis=0) + 1e-9)
+        for i, name in enumerate(("eig1", "eig2")):
+            pts = self._eig_pts[i]
+            pts[1, :2] = vecs[:, i]
+            self._eig_polys[i].GetPoints().Modified()
+            self._actors[name].SetVisibility(True)
@@ -18,6 +18,13 @@ class ParamPanel(QtWidgets.QWidget):
         self._form.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
         self.setLayout(self._form)
 
+        # Coalesce rapid widget edits (e.g. spinbox drags) into at most
+        # ~one paramsChanged emission per frame.
+        self._emit_timer = QtCore.QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self._do_emit)
+
     # --------------------- Public API ---------------------
     def build_from_schema(self, schema: Sequence[ParamSpec]) -> None:
         # clear
@@ -75,11 +82,15 @@ class ParamPanel(QtWidgets.QWidget):
                     sb.setDecimals(4)
                     sb.setRange(spec.min or -1e6, spec.max or 1e6)
                     sb.setSingleStep(spec.step or 0.1)
-                    sb.valueChanged.connect(self._emit_params)
-                # defaults
+                    # Emit once per committed edit, not per keystroke
+                    sb.setKeyboardTracking(False)
+                # defaults go in before the connects below so the setValue
+                # calls cannot emit partial-state paramsChanged signals
                 d = spec.default or [[1, 0], [0, 1]]
                 a11.setValue(float(d[0][0])); a12.setValue(float(d[0][1]))
                 a21.setValue(float(d[1][0])); a22.setValue(float(d[1][1]))
+                for sb in (a11, a12, a21, a22):
+                    sb.valueChanged.connect(self._emit_params)
 
                 grid.addWidget(a11, 0, 0); grid.addWidget(a12, 0, 1)
                 grid.addWidget(a21, 1, 0); grid.addWidget(a22, 1, 1)
@@ -107,5 +118,11 @@ class ParamPanel(QtWidgets.QWidget):
         return params
 
     # --------------------- Internals ---------------------
+    @QtCore.Slot()
     def _emit_params(self) -> None:
+        # Debounced: (re)start the timer; actual emission happens in _do_emit.
+        self._emit_timer.start()
+
+    @QtCore.Slot()
+    def _do_emit(self) -> None:
         self.paramsChanged.emit(self.current_params())
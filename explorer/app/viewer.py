@@ -1,8 +1,6 @@
 from __future__ import annotations
 from typing import Optional
-from PySide6 import QtWidgets
-from pyvistaqt import QtInteractor
-import pyvista as pv
+from PySide6 import QtCore, QtWidgets
 
 
 class ViewerWidget(QtWidgets.QWidget):
@@ -11,6 +9,10 @@ class ViewerWidget(QtWidgets.QWidget):
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
 
+        # Deferred: pulling in pyvistaqt loads VTK (~1s cold), so pay for it
+        # only when a viewer is actually instantiated
+        from pyvistaqt import QtInteractor
+
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
@@ -25,9 +27,17 @@ class ViewerWidget(QtWidgets.QWidget):
         self.plotter.show_grid()
 
     # --------------------- Facade helpers ---------------------
+    @QtCore.Slot()
     def render(self) -> None:
         self.plotter.update()  # triggers a redraw
 
+    @QtCore.Slot()
+    def fast_render(self) -> None:
+        # Plain VTK render, without plotter.update()'s Qt event processing —
+        # enough when actors were only mutated in place (points + Modified())
+        self.plotter.render()
+
+    @QtCore.Slot()
     def reset_camera(self) -> None:
         self.plotter.reset_camera()
         self.render()
@@ -40,6 +50,7 @@ class ViewerWidget(QtWidgets.QWidget):
             self._axes = self.plotter.add_axes()
         self.render()
 
+    @QtCore.Slot(bool)
     def set_grid_visible(self, visible: bool) -> None:
         self._grid_shown = visible
         if visible:
@@ -48,6 +59,7 @@ class ViewerWidget(QtWidgets.QWidget):
             self.plotter.remove_bounds_axes()
         self.render()
 
+    @QtCore.Slot(bool)
     def set_axes_visible(self, visible: bool) -> None:
         self._axes_shown = visible
         # there is no direct on/off; re-add or clear them